@@ -878,12 +878,11 @@ class Configurator(MutableMapping, dict):
         # are being read rather than after the end of the file reading.
         if isinstance(value, np.ndarray):
             value = value.item() if value.size == 1 else value.tolist()
-        validate_matplotlib = getattr(rc_matplotlib, 'validate', None)
-        validate_proplot = rc_proplot._validate
-        if validate_matplotlib is not None and key in validate_matplotlib:
-            value = validate_matplotlib[key](value)
-        elif key in validate_proplot:
-            value = validate_proplot[key](value)
+        validator = getattr(rc_matplotlib, 'validate', {}).get(key, None)
+        if validator is None:
+            validator = rc_proplot._validate.get(key, None)
+        if validator is not None:
+            value = validator(value)
         return value
 
     def _get_item_context(self, key, mode=None):
@@ -923,7 +922,8 @@ class Configurator(MutableMapping, dict):
         key, value = self._validate_key(key, value)
         value = self._validate_value(key, value)
         keys = (key,) + rcsetup._rc_children.get(key, ())  # settings to change
-        contains = lambda *args: any(arg in keys for arg in args)  # noqa: E731
+        keyset = frozenset(keys)
+        contains = lambda *args: not keyset.isdisjoint(args)  # noqa: E731
 
         # Fill dictionaries of matplotlib and proplot settings
         # NOTE: Raise key error right away so it can be caught by _load_file().
@@ -936,7 +936,7 @@ class Configurator(MutableMapping, dict):
             for key in keys:
                 if key in rc_matplotlib:
                     kw_matplotlib[key] = value
-                elif key in rc_proplot:
+                elif key in rcsetup._rc_proplot_keys:
                     kw_proplot[key] = value
                 else:
                     raise KeyError(f'Invalid rc setting {key!r}.')
@@ -1730,12 +1730,14 @@ class Configurator(MutableMapping, dict):
         Configurator.save
         """
         # Carefully detect changed settings
+        # NOTE: Try the cheap equality check before the much slower np.isclose(),
+        # since the vast majority of settings are unchanged from their defaults.
         rcdict = {}
         for key, value in self.items():
             default = rcsetup._get_default_param(key)
-            if isinstance(value, Real) and isinstance(default, Real) and np.isclose(value, default):  # noqa: E501
+            if value == default:
                 pass
-            elif value == default:
+            elif isinstance(value, Real) and isinstance(default, Real) and np.isclose(value, default):  # noqa: E501
                 pass
             else:
                 rcdict[key] = value
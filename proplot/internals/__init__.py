@@ -3,6 +3,7 @@
 Internal utilities.
 """
 # Import statements
+import functools
 import inspect
 from numbers import Integral, Real
 
@@ -12,7 +13,7 @@ from matplotlib import rcParams as rc_matplotlib
 try:  # print debugging (used with internal modules)
     from icecream import ic
 except ImportError:  # graceful fallback if IceCream isn't installed
-    ic = lambda *args: print(*args)  # noqa: E731
+    from builtins import print as ic  # noqa: F401
 
 
 def _not_none(*args, default=None, **kwargs):
@@ -20,30 +21,34 @@ def _not_none(*args, default=None, **kwargs):
     Return the first non-``None`` value. This is used with keyword arg aliases and
     for setting default values. Use `kwargs` to issue warnings when multiple passed.
     """
-    first = default
-    if args and kwargs:
-        raise ValueError('_not_none can only be used with args or kwargs.')
-    elif args:
+    if not kwargs:  # fast path for the common positional-only case
         for arg in args:
             if arg is not None:
-                first = arg
-                break
-    elif kwargs:
-        for name, arg in list(kwargs.items()):
-            if arg is not None:
-                first = arg
-                break
+                return arg
+        return default
+    if args:
+        raise ValueError('_not_none can only be used with args or kwargs.')
+    first, count = default, 0
+    for arg in kwargs.values():
+        if arg is None:
+            continue
+        if not count:
+            first = arg
+        count += 1
+    if count > 1:  # only filter the dictionary when needed for the warning
         kwargs = {name: arg for name, arg in kwargs.items() if arg is not None}
-        if len(kwargs) > 1:
-            warnings._warn_proplot(
-                f'Got conflicting or duplicate keyword arguments: {kwargs}. '
-                'Using the first keyword argument.'
-            )
+        warnings._warn_proplot(
+            f'Got conflicting or duplicate keyword arguments: {kwargs}. '
+            'Using the first keyword argument.'
+        )
     return first
 
 
 # Internal import statements
 # WARNING: Must come after _not_none because this is leveraged inside other funcs
+# NOTE: The 'fonts' module is imported only for its side effect of patching the
+# matplotlib mathtext 'custom' font class. Nothing else imports it, so it must be
+# imported here and should never be made lazy.
 from . import (  # noqa: F401
     benchmarks,
     context,
@@ -132,6 +137,19 @@ _alias_maps = {
 }
 
 
+# Internal parameters. These are popped by _pop_params but omitted from the
+# output when ignore_internal=True. Frozen here to avoid rebuilding on each call.
+_internal_params = frozenset((
+    'default_cmap',
+    'default_discrete',
+    'inbounds',
+    'plot_contours',
+    'plot_lines',
+    'skip_autolev',
+    'to_centers',
+))
+
+
 # Unit docstrings
 # NOTE: Try to fit this into a single line. Cannot break up with newline as that will
 # mess up docstring indentation since this is placed in indented param lines.
@@ -239,25 +257,44 @@ def _get_aliases(category, *keys):
     return tuple(aliases)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_options(options):
+    """
+    Return the options with each entry translated to a tuple of keys. This is cached
+    since `_kwargs_to_args` is called with the same few options on every plotting call.
+    """
+    return tuple((keys,) if isinstance(keys, str) else tuple(keys) for keys in options)
+
+
 def _kwargs_to_args(options, *args, allow_extra=False, **kwargs):
     """
     Translate keyword arguments to positional arguments. Permit omitted
-    arguments so that plotting functions can infer values.
+    arguments so that plotting functions can infer values. The options
+    must be a tuple of strings or tuples of strings (so they can be cached).
     """
+    options = _get_options(options)
     nargs, nopts = len(args), len(options)
     if nargs > nopts and not allow_extra:
         raise ValueError(f'Expected up to {nopts} positional arguments. Got {nargs}.')
     args = list(args)  # WARNING: Axes.text() expects return type of list
-    args.extend(None for _ in range(nopts - nargs))  # fill missing args
+    if nopts > nargs:
+        args += [None] * (nopts - nargs)  # fill missing args
+    pop = kwargs.pop  # avoid attribute lookups in the loop below
     for idx, keys in enumerate(options):
-        if isinstance(keys, str):
-            keys = (keys,)
-        opts = {}
-        if args[idx] is not None:  # positional args have first priority
-            opts[keys[0] + '_positional'] = args[idx]
+        value, name, opts = args[idx], None, None  # positional args have priority
         for key in keys:  # keyword args
-            opts[key] = kwargs.pop(key, None)
-        args[idx] = _not_none(**opts)  # may reassign None
+            opt = pop(key, None)
+            if opt is None:
+                continue
+            if value is None:
+                value, name = opt, key
+                continue
+            if opts is None:  # only build dictionary for conflicting values
+                opts = {_not_none(name, keys[0] + '_positional'): value}
+            opts[key] = opt
+        if opts is not None:
+            value = _not_none(**opts)  # issue warning
+        args[idx] = value  # may reassign None
     return args, kwargs
 
 
@@ -266,45 +303,82 @@ def _pop_kwargs(kwargs, *keys, **aliases):
     Pop the input properties and return them in a new dictionary.
     """
     output = {}
+    pop = kwargs.pop  # avoid attribute lookups in the loop below
     aliases.update({key: () for key in keys})
-    for key, aliases in aliases.items():
-        aliases = (aliases,) if isinstance(aliases, str) else aliases
-        opts = {key: kwargs.pop(key, None) for key in (key, *aliases)}
-        value = _not_none(**opts)
+    for key, names in aliases.items():
+        names = (names,) if isinstance(names, str) else names
+        value, name, opts = pop(key, None), key, None
+        for alias in names:
+            opt = pop(alias, None)
+            if opt is None:
+                continue
+            if value is None:
+                value, name = opt, alias
+                continue
+            if opts is None:  # only build dictionary for conflicting values
+                opts = {name: value}
+            opts[alias] = opt
+        if opts is not None:
+            value = _not_none(**opts)  # issue warning
         if value is not None:
             output[key] = value
     return output
 
 
+@functools.lru_cache(maxsize=None)
+def _get_params(func):
+    """
+    Return the parameter names for the input function. This is cached since
+    `_pop_params` is called with the same few functions on every plotting command.
+    """
+    # NOTE: Read names from the code object of plain functions rather than building a
+    # signature. Fall back to the signature for partials and decorated functions.
+    if (
+        not inspect.isfunction(func)
+        or hasattr(func, '__wrapped__')
+        or hasattr(func, '__signature__')
+    ):
+        return tuple(inspect.signature(func).parameters)
+    code = func.__code__
+    names = code.co_varnames
+    nargs, nkwargs = code.co_argcount, code.co_kwonlyargcount
+    idx = nargs + nkwargs  # index of *args or **kwargs name
+    params = names[:nargs]
+    if code.co_flags & inspect.CO_VARARGS:
+        params += (names[idx],)
+        idx += 1
+    params += names[nargs:nargs + nkwargs]
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        params += (names[idx],)
+    return params
+
+
 def _pop_params(kwargs, *funcs, ignore_internal=False):
     """
     Pop parameters of the input functions or methods.
     """
-    internal_params = {
-        'default_cmap',
-        'default_discrete',
-        'inbounds',
-        'plot_contours',
-        'plot_lines',
-        'skip_autolev',
-        'to_centers',
-    }
     output = {}
+    pop = kwargs.pop  # avoid attribute lookups in the loop below
     for func in funcs:
+        if not kwargs:  # nothing left to pop
+            break
+        # NOTE: Cache the underlying function of bound methods and drop 'self'. Caching
+        # the bound methods themselves would miss on every access and leak instances.
         if isinstance(func, inspect.Signature):
-            sig = func
+            params = func.parameters
+        elif inspect.ismethod(func):
+            params = _get_params(func.__func__)[1:]
         elif callable(func):
-            sig = inspect.signature(func)
+            params = _get_params(func)
         elif func is None:
             continue
         else:
             raise RuntimeError(f'Internal error. Invalid function {func!r}.')
-        for key in sig.parameters:
-            value = kwargs.pop(key, None)
-            if ignore_internal and key in internal_params:
+        for key in params:
+            value = pop(key, None)
+            if value is None or ignore_internal and key in _internal_params:
                 continue
-            if value is not None:
-                output[key] = value
+            output[key] = value
     return output
 
 
@@ -4,8 +4,10 @@ Utilities for global configuration.
 """
 import functools
 import re
+from collections import namedtuple
 from collections.abc import MutableMapping
 from numbers import Integral, Real
+from types import MappingProxyType
 
 import matplotlib.rcsetup as msetup
 import numpy as np
@@ -73,6 +75,11 @@ WHITE = 'white'
 ZLINES = 2  # default zorder for lines
 ZPATCHES = 1
 
+# Derived minor tick and gridline properties
+GRIDWIDTHMINOR = GRIDRATIO * LINEWIDTH
+TICKLENMINOR = TICKLEN * TICKLENRATIO
+TICKWIDTHMINOR = LINEWIDTH * TICKWIDTHRATIO
+
 # Preset legend locations and aliases
 LEGEND_LOCS = {
     'fill': 'fill',
@@ -166,16 +173,17 @@ PT_KEYS = (
 FONT_KEYS = set()  # dynamically add to this below
 
 
+@functools.lru_cache(maxsize=None)
 def _get_default_param(key):
     """
     Get the default parameter from one of three places. This is used for
-    the :rc: role when compiling docs and when saving proplotrc files.
+    the :rc: role when compiling docs and when saving proplotrc files. The
+    result is cached since the default dictionaries are never modified.
     """
     sentinel = object()
     for dict_ in (
         _rc_proplot_default,
-        _rc_matplotlib_default,  # imposed defaults
-        _rc_matplotlib_native,  # native defaults
+        _rc_matplotlib_full,  # native defaults updated with imposed defaults
     ):
         value = dict_.get(key, sentinel)
         if value is not sentinel:
@@ -209,7 +217,13 @@ def _validate_belongs(*options):
     """
     Return a validator ensuring the item belongs in the list.
     """
+    strings = {}  # case-insensitive string lookup
+    for opt in options:
+        if isinstance(opt, str):
+            strings.setdefault(opt.lower(), opt)
     def _validate_belongs(value):  # noqa: E306
+        if isinstance(value, str) and value.lower() in strings:
+            return strings[value.lower()]
         for opt in options:
             if isinstance(value, str) and isinstance(opt, str):
                 if value.lower() == opt.lower():  # noqa: E501
@@ -227,6 +241,16 @@ def _validate_belongs(*options):
     return _validate_belongs
 
 
+def _validate_bool(value):
+    """
+    Validate boolean settings. Return actual booleans right away and
+    otherwise use the matplotlib validator to parse e.g. ``'on'`` or ``1``.
+    """
+    if value is True or value is False:
+        return value
+    return msetup.validate_bool(value)
+
+
 def _validate_cmap(subtype):
     """
     Validate the colormap or cycle. Possibly skip name registration check
@@ -339,9 +363,11 @@ def _validate_labels(labels, lon=True):
     return array
 
 
+@functools.lru_cache(maxsize=None)
 def _validate_or_none(validator):
     """
-    Allow none otherwise pass to the input validator.
+    Allow none otherwise pass to the input validator. Cached so that each
+    validator is only ever wrapped once.
     """
     @functools.wraps(validator)
     def _validate_or_none(value):
@@ -381,15 +407,14 @@ def _rst_table():
     """
     # Initial stuff
     colspace = 2  # spaces between each column
-    descrips = tuple(descrip for (_, _, descrip) in _rc_proplot_table.values())
-    keylen = len(max((*_rc_proplot_table, 'Key'), key=len)) + 4  # literal backticks
-    vallen = len(max((*descrips, 'Description'), key=len))
+    keylen = len(max((*_rc_proplot_descrip, 'Key'), key=len)) + 4  # literal backticks
+    vallen = len(max((*_rc_proplot_descrip.values(), 'Description'), key=len))
     divider = '=' * keylen + ' ' * colspace + '=' * vallen + '\n'
     header = 'Key' + ' ' * (keylen - 3 + colspace) + 'Description\n'
 
     # Build table
     string = divider + header + divider
-    for key, (_, _, descrip) in _rc_proplot_table.items():
+    for key, descrip in _rc_proplot_descrip.items():
         spaces = ' ' * (keylen - (len(key) + 4) + colspace)
         string += f'``{key}``{spaces}{descrip}\n'
 
@@ -458,6 +483,11 @@ def _yaml_table(rcdict, comment=True, description=False):
     return string.strip()
 
 
+# Proplot settings table entry. Remains compatible with (default, validator,
+# description) tuple unpacking e.g. in _yaml_table().
+_RcEntry = namedtuple('_RcEntry', ('default', 'validator', 'descrip'))
+
+
 class _RcParams(MutableMapping, dict):
     """
     A simple dictionary with locked inputs and validated assignments.
@@ -489,10 +519,11 @@ class _RcParams(MutableMapping, dict):
 
     def __setitem__(self, key, value):
         key, value = self._check_key(key, value)
-        if key not in self._validate:
+        validator = self._validate.get(key, None)
+        if validator is None:
             raise KeyError(f'Invalid rc key {key!r}.')
         try:
-            value = self._validate[key](value)
+            value = validator(value)
         except (ValueError, TypeError) as error:
             raise ValueError(f'Key {key}: {error}') from None
         if key is not None:
@@ -536,13 +567,21 @@ class _RcParams(MutableMapping, dict):
 _validate_pt = _validate_units('pt')
 _validate_em = _validate_units('em')
 _validate_in = _validate_units('in')
-_validate_bool = msetup.validate_bool
 _validate_int = msetup.validate_int
 _validate_float = msetup.validate_float
 _validate_string = msetup.validate_string
 _validate_fontname = msetup.validate_stringlist  # same as 'font.family'
 _validate_fontweight = getattr(msetup, 'validate_fontweight', _validate_string)
 
+# Shared 'or none' validators
+# NOTE: Create these once rather than allocating a new wrapper for every setting.
+_validate_bool_or_none = _validate_or_none(_validate_bool)
+_validate_em_or_none = _validate_or_none(_validate_em)
+_validate_float_or_none = _validate_or_none(_validate_float)
+_validate_fontsize_or_none = _validate_or_none(_validate_fontsize)
+_validate_pt_or_none = _validate_or_none(_validate_pt)
+_validate_string_or_none = _validate_or_none(_validate_string)
+
 # Special style validators
 # See: https://matplotlib.org/stable/api/_as_gen/matplotlib.patches.FancyBboxPatch.html
 _validate_boxstyle = _validate_belongs(
@@ -555,6 +594,16 @@ else:  # no dashes allowed then but no big deal
         '-', ':', '--', '-.', 'solid', 'dashed', 'dashdot', 'dotted', 'none', ' ', '',
     )
 
+# Shared location, colormap, and color validators
+# NOTE: These are also used to patch the matplotlib validators below.
+_validate_cmap_continuous = _validate_cmap('continuous')
+_validate_cmap_discrete = _validate_cmap('discrete')
+_validate_color_or_auto = functools.partial(_validate_color, alternative='auto')
+_validate_color_or_inherit = functools.partial(_validate_color, alternative='inherit')
+_validate_loc_colorbar = _validate_belongs(*COLORBAR_LOCS)
+_validate_loc_legend = _validate_belongs(*LEGEND_LOCS)
+_validate_loc_text = _validate_belongs(*TEXT_LOCS)
+
 # Patch existing matplotlib validators.
 # NOTE: validate_fontsizelist is unused in recent matplotlib versions and
 # validate_colorlist is only used with prop cycle eval (which we don't care about)
@@ -565,24 +614,27 @@ if not hasattr(RcParams, 'validate'):  # not mission critical so skip
     warnings._warn_proplot('Failed to update matplotlib rcParams validators.')
 else:
     _validate = RcParams.validate
-    _validate['image.cmap'] = _validate_cmap('continuous')
-    _validate['legend.loc'] = _validate_belongs(*LEGEND_LOCS)
+    _validate['image.cmap'] = _validate_cmap_continuous
+    _validate['legend.loc'] = _validate_loc_legend
     for _key, _validator in _validate.items():
         if _validator is getattr(msetup, 'validate_fontsize', None):  # should exist
             FONT_KEYS.add(_key)
             _validate[_key] = _validate_fontsize
         if _validator is getattr(msetup, 'validate_fontsize_None', None):
             FONT_KEYS.add(_key)
-            _validate[_key] = _validate_or_none(_validate_fontsize)
+            _validate[_key] = _validate_fontsize_or_none
         if _validator is getattr(msetup, 'validate_font_properties', None):
             _validate[_key] = _validate_fontprops
         if _validator is getattr(msetup, 'validate_color', None):  # should exist
             _validate[_key] = _validate_color
         if _validator is getattr(msetup, 'validate_color_or_auto', None):
-            _validate[_key] = functools.partial(_validate_color, alternative='auto')
+            _validate[_key] = _validate_color_or_auto
         if _validator is getattr(msetup, 'validate_color_or_inherit', None):
-            _validate[_key] = functools.partial(_validate_color, alternative='inherit')
-    for _keys, _validator_replace in ((EM_KEYS, _validate_em), (PT_KEYS, _validate_pt)):
+            _validate[_key] = _validate_color_or_inherit
+    for _keys, _validator_replace, _validator_replace_or_none in (
+        (EM_KEYS, _validate_em, _validate_em_or_none),
+        (PT_KEYS, _validate_pt, _validate_pt_or_none),
+    ):
         for _key in _keys:
             _validator = _validate.get(_key, None)
             if _validator is None:
@@ -590,7 +642,7 @@ else:
             if _validator is msetup.validate_float:
                 _validate[_key] = _validator_replace
             if _validator is getattr(msetup, 'validate_float_or_None'):
-                _validate[_key] = _validate_or_none(_validator_replace)
+                _validate[_key] = _validator_replace_or_none
 
 
 # Proplot overrides of matplotlib default style
@@ -750,8 +802,8 @@ _rc_matplotlib_default = {
     'xtick.major.size': TICKLEN,
     'xtick.major.width': LINEWIDTH,
     'xtick.minor.pad': TICKPAD,
-    'xtick.minor.size': TICKLEN * TICKLENRATIO,
-    'xtick.minor.width': LINEWIDTH * TICKWIDTHRATIO,
+    'xtick.minor.size': TICKLENMINOR,
+    'xtick.minor.width': TICKWIDTHMINOR,
     'xtick.minor.visible': TICKMINOR,
     'ytick.color': BLACK,
     'ytick.direction': TICKDIR,
@@ -760,8 +812,8 @@ _rc_matplotlib_default = {
     'ytick.major.size': TICKLEN,
     'ytick.major.width': LINEWIDTH,
     'ytick.minor.pad': TICKPAD,
-    'ytick.minor.size': TICKLEN * TICKLENRATIO,
-    'ytick.minor.width': LINEWIDTH * TICKWIDTHRATIO,
+    'ytick.minor.size': TICKLENMINOR,
+    'ytick.minor.width': TICKWIDTHMINOR,
     'ytick.minor.visible': TICKMINOR,
 }
 if 'mathtext.fallback' in _rc_matplotlib_native:
@@ -778,11 +830,97 @@ _addendum_font = (
     ' Must be a :ref:`relative font size <font_table>` or unit string '
     'interpreted by `~proplot.utils.units`. Numeric units are points.'
 )
+
+# Geographic feature settings. Each feature has a toggle, opacity, color, and
+# zorder setting. Line features also have a line width setting.
+# NOTE: The toggle description can include extra detail, e.g. for innerborders.
+_rc_geo_table = {}
+for _name, _descrip, _toggle, _color, _lines in (
+    ('borders', 'country border lines', 'country border lines', BLACK, True),
+    ('coast', 'coast lines', 'coast lines', BLACK, True),
+    (
+        'innerborders',
+        'internal political border lines',
+        'internal political border lines (e.g. states and provinces)',
+        BLACK,
+        True,
+    ),
+    ('lakes', 'lake patches', 'lake patches', WHITE, False),
+    ('land', 'land patches', 'land patches', BLACK, False),
+    ('ocean', 'ocean patches', 'ocean patches', WHITE, False),
+    ('rivers', 'river lines', 'river lines', BLACK, True),
+):
+    _table = _rc_geo_table[_name] = {}
+    _table[_name] = (
+        False,
+        _validate_bool,
+        f'Toggles {_toggle} on and off.'
+    )
+    _table[_name + '.alpha'] = (
+        None,
+        _validate_float_or_none,
+        f'Opacity for {_descrip}.'
+    )
+    _table[_name + '.color'] = (
+        _color,
+        _validate_color,
+        ('Line' if _lines else 'Face') + f' color for {_descrip}.'
+    )
+    if _lines:
+        _table[_name + '.linewidth'] = (
+            LINEWIDTH,
+            _validate_pt,
+            f'Line width for {_descrip}.'
+        )
+    _table[_name + '.zorder'] = (
+        ZLINES if _lines else ZPATCHES,
+        _validate_float,
+        f'Z-order for {_descrip}.'
+    )
+
+# Subplot label settings. Each side has a color, padding, rotation, size, and
+# weight setting. Row labels are vertical and column labels are horizontal.
+_rc_label_table = {}
+for _side, _descrip, _rotation in (
+    ('bottom', 'column labels on the bottom of the figure', 'horizontal'),
+    ('left', 'row labels on the left-hand side', 'vertical'),
+    ('right', 'row labels on the right-hand side', 'vertical'),
+    ('top', 'column labels on the top of the figure', 'horizontal'),
+):
+    _name = _side + 'label'
+    _rc_label_table[_side] = {
+        _name + '.color': (
+            BLACK,
+            _validate_color,
+            f'Font color for {_descrip}.'
+        ),
+        _name + '.pad': (
+            TITLEPAD,
+            _validate_pt,
+            f'Padding between axes content and {_descrip}.' + _addendum_pt
+        ),
+        _name + '.rotation': (
+            _rotation,
+            _validate_rotation,
+            f'Rotation for {_descrip}.' + _addendum_rotation
+        ),
+        _name + '.size': (
+            LARGESIZE,
+            _validate_fontsize,
+            f'Font size for {_descrip}.' + _addendum_font
+        ),
+        _name + '.weight': (
+            'bold',
+            _validate_fontweight,
+            f'Font weight for {_descrip}.'
+        ),
+    }
+
 _rc_proplot_table = {
     # Stylesheet
     'style': (
         None,
-        _validate_or_none(_validate_string),
+        _validate_string_or_none,
         'The default matplotlib `stylesheet '
         '<https://matplotlib.org/stable/gallery/style_sheets/style_sheets_reference.html>`__ '  # noqa: E501
         'name. If ``None``, a custom proplot style is used. '
@@ -831,7 +969,7 @@ _rc_proplot_table = {
     ),
     'abc.bboxpad': (
         None,
-        _validate_or_none(_validate_pt),
+        _validate_pt_or_none,
         'Padding for the a-b-c label bounding box. By default this is scaled '
         'to make the box flush against the subplot edge.' + _addendum_pt
     ),
@@ -842,7 +980,7 @@ _rc_proplot_table = {
     ),
     'abc.loc': (
         'left',  # left side above the axes
-        _validate_belongs(*TEXT_LOCS),
+        _validate_loc_text,
         'a-b-c label position. '
         'For options see the :ref:`location table <title_table>`.'
     ),
@@ -875,7 +1013,7 @@ _rc_proplot_table = {
     # Axes additions
     'axes.alpha': (
         None,
-        _validate_or_none(_validate_float),
+        _validate_float_or_none,
         'Opacity of the background axes patch.'
     ),
     'axes.inbounds': (
@@ -891,86 +1029,13 @@ _rc_proplot_table = {
     ),
 
     # Country borders
-    'borders': (
-        False,
-        _validate_bool,
-        'Toggles country border lines on and off.'
-    ),
-    'borders.alpha': (
-        None,
-        _validate_or_none(_validate_float),
-        'Opacity for country border lines.',
-    ),
-    'borders.color': (
-        BLACK,
-        _validate_color,
-        'Line color for country border lines.'
-    ),
-    'borders.linewidth': (
-        LINEWIDTH,
-        _validate_pt,
-        'Line width for country border lines.'
-    ),
-    'borders.zorder': (
-        ZLINES,
-        _validate_float,
-        'Z-order for country border lines.'
-    ),
+    **_rc_geo_table['borders'],
 
     # Bottom subplot labels
-    'bottomlabel.color': (
-        BLACK,
-        _validate_color,
-        'Font color for column labels on the bottom of the figure.'
-    ),
-    'bottomlabel.pad': (
-        TITLEPAD,
-        _validate_pt,
-        'Padding between axes content and column labels on the bottom of the figure.'
-        + _addendum_pt
-    ),
-    'bottomlabel.rotation': (
-        'horizontal',
-        _validate_rotation,
-        'Rotation for column labels at the bottom of the figure.' + _addendum_rotation
-    ),
-    'bottomlabel.size': (
-        LARGESIZE,
-        _validate_fontsize,
-        'Font size for column labels on the bottom of the figure.' + _addendum_font
-    ),
-    'bottomlabel.weight': (
-        'bold',
-        _validate_fontweight,
-        'Font weight for column labels on the bottom of the figure.'
-    ),
+    **_rc_label_table['bottom'],
 
     # Coastlines
-    'coast': (
-        False,
-        _validate_bool,
-        'Toggles coastline lines on and off.'
-    ),
-    'coast.alpha': (
-        None,
-        _validate_or_none(_validate_float),
-        'Opacity for coast lines',
-    ),
-    'coast.color': (
-        BLACK,
-        _validate_color,
-        'Line color for coast lines.'
-    ),
-    'coast.linewidth': (
-        LINEWIDTH,
-        _validate_pt,
-        'Line width for coast lines.'
-    ),
-    'coast.zorder': (
-        ZLINES,
-        _validate_float,
-        'Z-order for coast lines.'
-    ),
+    **_rc_geo_table['coast'],
 
     # Colorbars
     'colorbar.edgecolor': (
@@ -1037,7 +1102,7 @@ _rc_proplot_table = {
     ),
     'colorbar.loc': (
         'right',
-        _validate_belongs(*COLORBAR_LOCS),
+        _validate_loc_colorbar,
         'Inset colorbar location. '
         'For options see the :ref:`location table <colorbar_table>`.'
     ),
@@ -1060,14 +1125,14 @@ _rc_proplot_table = {
     # Color cycle additions
     'cycle': (
         CYCLE,
-        _validate_cmap('discrete'),
+        _validate_cmap_discrete,
         'Name of the color cycle assigned to :rcraw:`axes.prop_cycle`.'
     ),
 
     # Colormap additions
     'cmap': (
         CMAPSEQ,
-        _validate_cmap('continuous'),
+        _validate_cmap_continuous,
         'Alias for :rcraw:`cmap.sequential` and :rcraw:`image.cmap`.'
     ),
     'cmap.autodiverging': (
@@ -1078,24 +1143,24 @@ _rc_proplot_table = {
     ),
     'cmap.qualitative': (
         CMAPCAT,
-        _validate_cmap('discrete'),
+        _validate_cmap_discrete,
         'Default colormap for qualitative datasets.'
     ),
     'cmap.cyclic': (
         CMAPCYC,
-        _validate_cmap('continuous'),
+        _validate_cmap_continuous,
         'Default colormap for cyclic datasets.'
     ),
     'cmap.discrete': (
         None,
-        _validate_or_none(_validate_bool),
+        _validate_bool_or_none,
         'If ``True``, `~proplot.colors.DiscreteNorm` is used for every colormap plot. '
         'If ``False``, it is never used. If ``None``, it is used for all plot types '
         'except `imshow`, `matshow`, `spy`, `hexbin`, and `hist2d`.'
     ),
     'cmap.diverging': (
         CMAPDIV,
-        _validate_cmap('continuous'),
+        _validate_cmap_continuous,
         'Default colormap for diverging datasets.'
     ),
     'cmap.inbounds': (
@@ -1132,7 +1197,7 @@ _rc_proplot_table = {
     ),
     'cmap.sequential': (
         CMAPSEQ,
-        _validate_cmap('continuous'),
+        _validate_cmap_continuous,
         'Default colormap for sequential datasets. Alias for :rcraw:`image.cmap`.'
     ),
 
@@ -1358,7 +1423,7 @@ _rc_proplot_table = {
         'Minor gridline style.'
     ),
     'gridminor.linewidth': (
-        GRIDRATIO * LINEWIDTH,
+        GRIDWIDTHMINOR,
         _validate_pt,
         'Minor gridline width.'
     ),
@@ -1368,7 +1433,7 @@ _rc_proplot_table = {
         'Minor gridline style. Alias for :rcraw:`gridminor.linestyle`.'
     ),
     'gridminor.width': (
-        GRIDRATIO * LINEWIDTH,
+        GRIDWIDTHMINOR,
         _validate_pt,
         'Minor gridline width. Alias for :rcraw:`gridminor.linewidth`.'
     ),
@@ -1382,32 +1447,7 @@ _rc_proplot_table = {
     ),
 
     # Inner borders
-    'innerborders': (
-        False,
-        _validate_bool,
-        'Toggles internal political border lines (e.g. states and provinces) '
-        'on and off.'
-    ),
-    'innerborders.alpha': (
-        None,
-        _validate_or_none(_validate_float),
-        'Opacity for internal political border lines',
-    ),
-    'innerborders.color': (
-        BLACK,
-        _validate_color,
-        'Line color for internal political border lines.'
-    ),
-    'innerborders.linewidth': (
-        LINEWIDTH,
-        _validate_pt,
-        'Line width for internal political border lines.'
-    ),
-    'innerborders.zorder': (
-        ZLINES,
-        _validate_float,
-        'Z-order for internal political border lines.'
-    ),
+    **_rc_geo_table['innerborders'],
 
     # Axis label settings
     'label.color': (
@@ -1433,76 +1473,13 @@ _rc_proplot_table = {
     ),
 
     # Lake patches
-    'lakes': (
-        False,
-        _validate_bool,
-        'Toggles lake patches on and off.'
-    ),
-    'lakes.alpha': (
-        None,
-        _validate_or_none(_validate_float),
-        'Opacity for lake patches',
-    ),
-    'lakes.color': (
-        WHITE,
-        _validate_color,
-        'Face color for lake patches.'
-    ),
-    'lakes.zorder': (
-        ZPATCHES,
-        _validate_float,
-        'Z-order for lake patches.'
-    ),
+    **_rc_geo_table['lakes'],
 
     # Land patches
-    'land': (
-        False,
-        _validate_bool,
-        'Toggles land patches on and off.'
-    ),
-    'land.alpha': (
-        None,
-        _validate_or_none(_validate_float),
-        'Opacity for land patches',
-    ),
-    'land.color': (
-        BLACK,
-        _validate_color,
-        'Face color for land patches.'
-    ),
-    'land.zorder': (
-        ZPATCHES,
-        _validate_float,
-        'Z-order for land patches.'
-    ),
+    **_rc_geo_table['land'],
 
     # Left subplot labels
-    'leftlabel.color': (
-        BLACK,
-        _validate_color,
-        'Font color for row labels on the left-hand side.'
-    ),
-    'leftlabel.pad': (
-        TITLEPAD,
-        _validate_pt,
-        'Padding between axes content and row labels on the left-hand side.'
-        + _addendum_pt
-    ),
-    'leftlabel.rotation': (
-        'vertical',
-        _validate_rotation,
-        'Rotation for row labels on the left-hand side.' + _addendum_rotation
-    ),
-    'leftlabel.size': (
-        LARGESIZE,
-        _validate_fontsize,
-        'Font size for row labels on the left-hand side.' + _addendum_font
-    ),
-    'leftlabel.weight': (
-        'bold',
-        _validate_fontweight,
-        'Font weight for row labels on the left-hand side.'
-    ),
+    **_rc_label_table['left'],
 
     # Meta settings
     'margin': (
@@ -1549,26 +1526,7 @@ _rc_proplot_table = {
     ),
 
     # Ocean patches
-    'ocean': (
-        False,
-        _validate_bool,
-        'Toggles ocean patches on and off.'
-    ),
-    'ocean.alpha': (
-        None,
-        _validate_or_none(_validate_float),
-        'Opacity for ocean patches',
-    ),
-    'ocean.color': (
-        WHITE,
-        _validate_color,
-        'Face color for ocean patches.'
-    ),
-    'ocean.zorder': (
-        ZPATCHES,
-        _validate_float,
-        'Z-order for ocean patches.'
-    ),
+    **_rc_geo_table['ocean'],
 
     # Geographic resolution
     'reso': (
@@ -1579,59 +1537,10 @@ _rc_proplot_table = {
     ),
 
     # Right subplot labels
-    'rightlabel.color': (
-        BLACK,
-        _validate_color,
-        'Font color for row labels on the right-hand side.'
-    ),
-    'rightlabel.pad': (
-        TITLEPAD,
-        _validate_pt,
-        'Padding between axes content and row labels on the right-hand side.'
-        + _addendum_pt
-    ),
-    'rightlabel.rotation': (
-        'vertical',
-        _validate_rotation,
-        'Rotation for row labels on the right-hand side.' + _addendum_rotation
-    ),
-    'rightlabel.size': (
-        LARGESIZE,
-        _validate_fontsize,
-        'Font size for row labels on the right-hand side.' + _addendum_font
-    ),
-    'rightlabel.weight': (
-        'bold',
-        _validate_fontweight,
-        'Font weight for row labels on the right-hand side.'
-    ),
+    **_rc_label_table['right'],
 
     # River lines
-    'rivers': (
-        False,
-        _validate_bool,
-        'Toggles river lines on and off.'
-    ),
-    'rivers.alpha': (
-        None,
-        _validate_or_none(_validate_float),
-        'Opacity for river lines.',
-    ),
-    'rivers.color': (
-        BLACK,
-        _validate_color,
-        'Line color for river lines.'
-    ),
-    'rivers.linewidth': (
-        LINEWIDTH,
-        _validate_pt,
-        'Line width for river lines.'
-    ),
-    'rivers.zorder': (
-        ZLINES,
-        _validate_float,
-        'Z-order for river lines.'
-    ),
+    **_rc_geo_table['rivers'],
 
     # Subplots settings
     'subplots.align': (
@@ -1828,7 +1737,7 @@ _rc_proplot_table = {
     ),
     'title.bboxpad': (
         None,
-        _validate_or_none(_validate_pt),
+        _validate_pt_or_none,
         'Padding for the title bounding box. By default this is scaled '
         'to make the box flush against the axes edge.' + _addendum_pt
     ),
@@ -1839,7 +1748,7 @@ _rc_proplot_table = {
     ),
     'title.loc': (
         'center',
-        _validate_belongs(*TEXT_LOCS),
+        _validate_loc_text,
         'Title position. For options see the :ref:`location table <title_table>`.'
     ),
     'title.pad': (
@@ -1860,32 +1769,7 @@ _rc_proplot_table = {
     ),
 
     # Top subplot label settings
-    'toplabel.color': (
-        BLACK,
-        _validate_color,
-        'Font color for column labels on the top of the figure.'
-    ),
-    'toplabel.pad': (
-        TITLEPAD,
-        _validate_pt,
-        'Padding between axes content and column labels on the top of the figure.'
-        + _addendum_pt
-    ),
-    'toplabel.rotation': (
-        'horizontal',
-        _validate_rotation,
-        'Rotation for column labels at the top of the figure.' + _addendum_rotation
-    ),
-    'toplabel.size': (
-        LARGESIZE,
-        _validate_fontsize,
-        'Font size for column labels on the top of the figure.' + _addendum_font
-    ),
-    'toplabel.weight': (
-        'bold',
-        _validate_fontweight,
-        'Font weight for column labels on the top of the figure.'
-    ),
+    **_rc_label_table['top'],
 
     # Unit formatting
     'unitformat': (
@@ -1896,6 +1780,9 @@ _rc_proplot_table = {
     ),
 }
 
+# Remove the template tables now that they are merged into the proplot table
+del _rc_geo_table, _rc_label_table, _table
+
 # Child settings. Changing the parent changes all the children, but
 # changing any of the children does not change the parent.
 _rc_children = {
@@ -1980,9 +1867,11 @@ _rc_synonyms = (
     ('title.weight', 'axes.titleweight'),
 )
 for _keys in _rc_synonyms:
+    _union = dict.fromkeys(_keys)  # ordered set
+    for _key in _keys:
+        _union.update(dict.fromkeys(_rc_children.get(_key, ())))
     for _key in _keys:
-        _set = {_ for k in _keys for _ in {k, *_rc_children.get(k, ())}} - {_key}
-        _rc_children[_key] = tuple(sorted(_set))
+        _rc_children[_key] = tuple(_ for _ in _union if _ != _key)
 
 # Previously removed settings.
 # NOTE: Initial idea was to defer deprecation warnings in Configurator to the
@@ -2050,20 +1939,42 @@ _rc_renamed = {  # {old_key: (new_key, version)} dictionary
     'colorbar.rasterize': ('colorbar.rasterized', '0.10.0'),
 }
 
-# Validate the default settings dictionaries using a custom proplot _RcParams
-# and the original matplotlib RcParams. Also surreptitiously add proplot
-# font settings to the font keys list (beoolean below always evalutes to True)
-# font keys list whlie initializing.
-_rc_proplot_default = {
-    key: value for key, (value, _, _) in _rc_proplot_table.items()
-}
-_rc_proplot_validate = {
-    key: validator for key, (_, validator, _) in _rc_proplot_table.items()
-    if not (validator is _validate_fontsize and FONT_KEYS.add(key))
+# Convert the proplot table entries to named records, then split the table into
+# separate default, validator, and description dictionaries so that lookups never
+# have to unpack the table entries. Also add proplot font settings to the font keys
+# list. Then validate the default settings using a custom proplot _RcParams and the
+# original matplotlib RcParams.
+_rc_proplot_table = {
+    _key: _RcEntry(*_entry) for _key, _entry in _rc_proplot_table.items()
 }
+_rc_proplot_default = {}
+_rc_proplot_validate = {}
+_rc_proplot_descrip = {}
+for _key, _entry in _rc_proplot_table.items():
+    _rc_proplot_default[_key] = _entry.default
+    _rc_proplot_validate[_key] = _entry.validator
+    _rc_proplot_descrip[_key] = _entry.descrip
+    if _entry.validator is _validate_fontsize:
+        FONT_KEYS.add(_key)
 _rc_proplot_default = _RcParams(_rc_proplot_default, _rc_proplot_validate)
 _rc_matplotlib_default = RcParams(_rc_matplotlib_default)
 
+# Native matplotlib defaults updated with the proplot overrides. Merged once here
+# so that _get_default_param() only has to search a single matplotlib dictionary.
+# NOTE: RcParams.copy() returns a plain dictionary without deprecation checks.
+_rc_matplotlib_full = _rc_matplotlib_native.copy()
+_rc_matplotlib_full.update(_rc_matplotlib_default)
+_rc_matplotlib_full = MappingProxyType(_rc_matplotlib_full)
+
+# Freeze the proplot settings table and deprecated settings and record the valid
+# setting names. Membership tests on the proxies use the underlying dict lookups.
+# NOTE: Membership tests should use _rc_proplot_keys rather than the _RcParams
+# instances, whose Mapping.__contains__ runs __getitem__ and _check_key.
+_rc_proplot_keys = frozenset(_rc_proplot_table)
+_rc_proplot_table = MappingProxyType(_rc_proplot_table)
+_rc_removed = MappingProxyType(_rc_removed)
+_rc_renamed = MappingProxyType(_rc_renamed)
+
 # Important joint matplotlib proplot constants
 # NOTE: The 'nodots' dictionary should include removed and renamed settings
 _rc_categories = {